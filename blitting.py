@@ -0,0 +1,40 @@
+# Shared blitting helper for the visualizer windows.
+
+
+class BlitManager:
+    # Caches everything outside a set of animated artists as a pixel
+    # background; update() restores that background and re-draws only the
+    # animated artists. The draw_event hook is the load-bearing part: any
+    # full canvas draw (first show, resize, expose) renders the scene
+    # without animated artists, so the handler recaptures the fresh
+    # background and paints the artists back on top — without it the
+    # figure comes up blank and blanks again on every resize until the
+    # next interaction.
+    def __init__(self, canvas, draw_animated, bbox=None):
+        # draw_animated is a callback that draw_artist()s the animated
+        # artists in stacking order; bbox is the region to blit (defaults
+        # to the whole figure)
+        self.canvas = canvas
+        self._draw_animated = draw_animated
+        self._bbox = bbox if bbox is not None else canvas.figure.bbox
+        self._bg = None
+        canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        self._bg = self.canvas.copy_from_bbox(self._bbox)
+        self._draw_animated()
+
+    def invalidate(self):
+        # Force a full draw on the next update (e.g. after a legend or
+        # limits change altered the static background)
+        self._bg = None
+
+    def update(self):
+        if self._bg is None:
+            # No valid background yet; a full draw recaptures it through
+            # _on_draw, which also re-paints the animated artists
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self._bg)
+            self._draw_animated()
+            self.canvas.blit(self._bbox)